@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 
 from icenet.data.datasets.utils import SplittingMixin
-from icenet.data.loader import IceNetDataLoaderFactory
+from icenet.data.loaders import get_data_loader_factory
 from icenet.data.producers import DataCollection
 from icenet.utils import setup_logging
 
@@ -148,7 +148,7 @@ class IceNetDataSet(SplittingMixin, DataCollection):
             n_forecast_days = self._config["n_forecast_days"]
         if generate_workers is None:
             generate_workers = self._config["generate_workers"]
-        loader = IceNetDataLoaderFactory().create_data_loader(
+        loader = get_data_loader_factory().create_data_loader(
             "dask",  # This will load the `DaskMultiWorkerLoader` class.
             self.loader_config,
             self.identifier,
@@ -258,7 +258,7 @@ class MergedIceNetDataSet(SplittingMixin, DataCollection):
         :param path:
         :param other:
         """
-        loader = IceNetDataLoaderFactory().create_data_loader(
+        loader = get_data_loader_factory().create_data_loader(
             "dask",
             other["loader_config"],
             other["identifier"],
@@ -4,7 +4,8 @@ import os
 
 import numpy as np
 
-from icenet.data.loaders import IceNetDataLoaderFactory
+from icenet.data.loaders import (IceNetDataLoaderFactory,
+                                  get_data_loader_factory)
 from icenet.data.cli import add_date_args, process_date_args
 from icenet.utils import setup_logging
 """
@@ -22,7 +23,7 @@ def create_get_args() -> object:
         An argparse.ArgumentParser object with all arguments added via `add_argument` accessible
             as object attributes.
     """
-    implementations = list(IceNetDataLoaderFactory().loader_map)
+    implementations = list(get_data_loader_factory().loader_map)
 
     ap = argparse.ArgumentParser()
     ap.add_argument("name", type=str)
@@ -103,7 +104,7 @@ def create():
     args = create_get_args()
     dates = process_date_args(args)
 
-    dl = IceNetDataLoaderFactory().create_data_loader(
+    dl = get_data_loader_factory().create_data_loader(
         args.implementation,
         "loader.{}.json".format(args.name),
         args.forecast_name if args.forecast_name else args.name,
@@ -149,4 +150,4 @@ def save_sample(output_folder: str, date: object, sample: tuple):
 
         logging.info("Saving {} - generated {} {}".format(
             date, directory, output.shape))
-        np.save(loader_output_path, output)
+        np.save(loader_output_path, output, allow_pickle=False)
@@ -1,24 +1,28 @@
-import inspect
+import functools
+import importlib
 
 from icenet.data.loaders.base import IceNetBaseDataLoader
 
-import icenet.data.loaders.dask
-import icenet.data.loaders.stdlib
-
 
 class IceNetDataLoaderFactory:
     """A factory class for managing a map of loader names and their corresponding implementation classes.
 
+    The built-in loaders are held as (module name, class name) pairs and only
+    imported when first created, so that listing the loaders does not import
+    their dependencies (e.g. dask.distributed).
+
     Attributes:
-        _loader_map: A dictionary holding loader names against their implementation classes.
+        _loader_map: A dictionary holding loader names against their implementation classes,
+            or the (module name, class name) pair of a loader not yet imported.
     """
 
     def __init__(self):
         """Initialises the IceNetDataLoaderFactory instance and sets up the initial loader map."""
         self._loader_map = dict(
-            dask=icenet.data.loaders.dask.DaskMultiWorkerLoader,
-            dask_shared=icenet.data.loaders.dask.DaskMultiSharingWorkerLoader,
-            standard=icenet.data.loaders.stdlib.IceNetDataLoader,
+            dask=("icenet.data.loaders.dask", "DaskMultiWorkerLoader"),
+            dask_shared=("icenet.data.loaders.dask",
+                         "DaskMultiSharingWorkerLoader"),
+            standard=("icenet.data.loaders.stdlib", "IceNetDataLoader"),
         )
 
     def add_data_loader(self, loader_name: str, loader_impl: object) -> None:
@@ -37,7 +41,7 @@ class IceNetDataLoaderFactory:
                 class is not a descendant of IceNetBaseDataLoader.
         """
         if loader_name not in self._loader_map:
-            if IceNetBaseDataLoader in inspect.getmro(loader_impl):
+            if issubclass(loader_impl, IceNetBaseDataLoader):
                 self._loader_map[loader_name] = loader_impl
             else:
                 raise RuntimeError("{} is not descended from "
@@ -61,9 +65,30 @@ class IceNetDataLoaderFactory:
         Raises:
             KeyError: If the loader name does not exist in `_loader_map`.
         """
-        return self._loader_map[loader_name](*args, **kwargs)
+        loader_impl = self._loader_map[loader_name]
+
+        if isinstance(loader_impl, tuple):
+            module_name, class_name = loader_impl
+            loader_impl = getattr(importlib.import_module(module_name),
+                                  class_name)
+            self._loader_map[loader_name] = loader_impl
+        return loader_impl(*args, **kwargs)
 
     @property
     def loader_map(self) -> dict:
-        """The loader map dictionary."""
+        """The loader map dictionary.
+
+        Loaders not yet created are given as their (module name, class name)
+            pair, so listing the names does not import them.
+        """
         return self._loader_map
+
+
+@functools.lru_cache(maxsize=None)
+def get_data_loader_factory() -> IceNetDataLoaderFactory:
+    """Gets the IceNetDataLoaderFactory shared across the process.
+
+    Returns:
+        The IceNetDataLoaderFactory instance, created on first call.
+    """
+    return IceNetDataLoaderFactory()
@@ -345,7 +345,7 @@ class IceNetPreProcessor(Processor):
         """
 
         logging.info("Opening files for {}".format(var_name))
-        logging.debug("Files: {}".format(self._var_files[var_name]))
+        logging.debug("Files: %s", self._var_files[var_name])
         ds = xr.open_mfdataset(
             self._var_files[var_name],
             # Solves issue with inheriting files without
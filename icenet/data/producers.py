@@ -2,15 +2,116 @@ from abc import abstractmethod, ABCMeta
 
 import collections
 import datetime as dt
-import glob
+import hashlib
+import json
 import logging
 import os
 import re
 
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 from icenet.utils import Hemisphere, HemisphereMixin
 
+YEAR_DIR_RE = re.compile(r"^\d{4}$")
+
+
+def _list_nc_dir(root: str,
+                 years: object = None,
+                 dir_cache: object = None) -> tuple:
+    """Lists the dated NetCDF files and subdirectories of a single directory.
+
+    Reads the directory once via `os.scandir`, whose entries cache the file
+        type from that read rather than needing a `stat` per file.
+
+    Args:
+        root: The directory to list.
+        years (optional): Year strings to restrict the listing to, so that year
+            directories and files for other years are skipped. Defaults to None.
+        dir_cache (optional): A dict of directory listings to reuse and add to,
+            keyed by directory path. Defaults to None.
+
+    Returns:
+        A tuple of a list of (file name, file path) tuples for the matching
+            files, and a list of subdirectory paths.
+    """
+    if dir_cache is not None and root in dir_cache:
+        listing = dir_cache[root]
+    else:
+        with os.scandir(root) as entries:
+            listing = [(entry.name, entry.path, entry.is_dir())
+                       for entry in entries
+                       if not entry.name.startswith(".")]
+
+        if dir_cache is not None:
+            dir_cache[root] = listing
+
+    files, subdirs = [], []
+
+    for name, path, is_dir in listing:
+        if is_dir:
+            if years is None or not YEAR_DIR_RE.match(name) or name in years:
+                subdirs.append(path)
+        elif name[0] in "12" and name.endswith(".nc"):
+            if years is None or name[:4] in years:
+                files.append((name, path))
+    return files, subdirs
+
+
+def _iter_nc_files(root: str,
+                   years: object = None,
+                   dir_cache: object = None) -> object:
+    """Walks a directory tree, yielding the dated NetCDF files within it.
+
+    Matches the same files as `glob.glob("{root}/**/[12]*.nc", recursive=True)`,
+        optionally restricted to the given years.
+
+    Args:
+        root: The directory to walk.
+        years (optional): Year strings to restrict the walk to. Defaults to None.
+        dir_cache (optional): A dict of directory listings to reuse and add to.
+            Defaults to None.
+
+    Yields:
+        Tuples of (file name, file path) for each matching file.
+    """
+    files, subdirs = _list_nc_dir(root, years, dir_cache)
+    yield from files
+
+    for subdir in subdirs:
+        yield from _iter_nc_files(subdir, years, dir_cache)
+
+
+def _scan_nc_files(root: str,
+                   years: object = None,
+                   dir_cache: object = None) -> list:
+    """Walks a directory tree for the dated NetCDF files within it, walking
+    each top level subdirectory in its own thread.
+
+    The walk is bound by directory reads, which release the GIL, so threads
+        overlap them well, notably on networked filesystems.
+
+    Args:
+        root: The directory to walk.
+        years (optional): Year strings to restrict the walk to. Defaults to None.
+        dir_cache (optional): A dict of directory listings to reuse and add to.
+            Defaults to None.
+
+    Returns:
+        A list of (file name, file path) tuples for each matching file.
+    """
+    files, subdirs = _list_nc_dir(root, years, dir_cache)
+
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, len(subdirs))) as executor:
+            for subdir_files in executor.map(
+                    lambda subdir: list(
+                        _iter_nc_files(subdir, years, dir_cache)), subdirs):
+                files.extend(subdir_files)
+    else:
+        for subdir in subdirs:
+            files.extend(_iter_nc_files(subdir, years, dir_cache))
+    return files
+
 
 class DataCollection(HemisphereMixin, metaclass=ABCMeta):
     """An Abstract base class with common interface for data collection classes.
@@ -73,6 +174,7 @@ class DataProducer(DataCollection):
     Attributes:
         dry: Flag specifying whether the data producer should be in dry run mode or not.
         overwrite: Flag specifying whether existing files should be overwritten or not.
+        _var_folder_cache: Set of the variable folder paths known to exist.
     """
 
     def __init__(self,
@@ -94,6 +196,8 @@ class DataProducer(DataCollection):
 
         self.dry = dry
         self.overwrite = overwrite
+        # Variable folders known to exist, to skip checking them on every call
+        self._var_folder_cache = set()
 
         if os.path.exists(self._path):
             logging.debug("{} already exists".format(self._path))
@@ -139,6 +243,9 @@ class DataProducer(DataCollection):
         data_var_path = os.path.join(self.base_path,
                                      *[hemisphere, var, *append])
 
+        if data_var_path in self._var_folder_cache:
+            return data_var_path
+
         if not os.path.exists(data_var_path):
             if not missing_error:
                 os.makedirs(data_var_path, exist_ok=True)
@@ -146,6 +253,7 @@ class DataProducer(DataCollection):
                 raise OSError("Directory {} is missing and this is "
                               "flagged as an error!".format(data_var_path))
 
+        self._var_folder_cache.add(data_var_path)
         return data_var_path
 
 
@@ -187,7 +295,10 @@ class Processor(DataProducer):
         _lead_time: Forecast/lead time used in the data processing.
         source_data: Path to the source data directory.
         _var_files: Dictionary storing variable files organised by variable name.
+        _dir_cache: Dictionary storing source directory listings organised by path.
+        _scan_cache: Flag specifying whether source data scans are cached on disk.
         _processed_files: Dictionary storing the processed files organised by variable name.
+        _processed_file_set: Set of all the processed file paths, for deduplication.
         _dates: Named tuple that stores the dates used for training, validation, and testing.
     """
 
@@ -197,6 +308,7 @@ class Processor(DataProducer):
                  *args,
                  file_filters: object = (),
                  lead_time: int = 93,
+                 scan_cache: bool = False,
                  test_dates: object = (),
                  train_dates: object = (),
                  val_dates: object = (),
@@ -211,6 +323,8 @@ class Processor(DataProducer):
                 during data processing. Defaults to ().
             lead_time (optional): The forecast/lead time used in the data processing.
                 Defaults to 93.
+            scan_cache (optional): Whether to cache the source data scan on disk,
+                under `.scan_cache` in the processor path. Defaults to False.
             test_dates (optional): Dates used for testing. Defaults to ().
             train_dates (optional): Dates used for training. Defaults to ().
             val_dates (optional): Dates used for validation. Defaults to ().
@@ -219,11 +333,18 @@ class Processor(DataProducer):
         super().__init__(*args, identifier=identifier, **kwargs)
 
         self._file_filters = list(file_filters)
+        self._file_filter_re = re.compile("|".join(
+            re.escape(flt) for flt in self._file_filters)) \
+            if self._file_filters else None
         self._lead_time = lead_time
+        self._scan_cache = scan_cache
         self._source_data = os.path.join(source_data, identifier,
                                          self.hemisphere_str[0])
         self._var_files = dict()
         self._processed_files = dict()
+        self._processed_file_set = set()
+        # Source directory listings, reused by repeated source data scans
+        self._dir_cache = dict()
 
         # TODO: better as a mixin? or maybe a Python data class instead?
         Dates = collections.namedtuple("Dates", ["train", "val", "test"])
@@ -232,125 +353,196 @@ class Processor(DataProducer):
                             test=list(test_dates))
 
     def init_source_data(self, lag_days: object = None) -> None:
-        """Initialises source data by globbing the files and organising based on date.
+        """Initialises source data by scanning the files and organising based on date.
+
+        Collects the files from `iter_source_files` by variable name.
+
+        Args:
+            lag_days: The number of lag days to include in the data processing.
+
+        Returns:
+            None. The method updates the `_var_files` attribute of the `Processor` object.
+
+        Raises:
+            OSError: If the source data directory does not exist.
+        """
+        var_files = {}
+
+        for var, df in self.iter_source_files(lag_days):
+            if var not in var_files.keys():
+                var_files[var] = list()
+            var_files[var].append(df)
+
+        # TODO: allow option to ditch dates from train/val/test for missing
+        #  var files
+        self._var_files = {
+            var: var_files[var]
+            for var in sorted(var_files.keys())
+        }
+        for var in self._var_files.keys():
+            logging.info("Got %d files for %s", len(self._var_files[var]),
+                         var)
+
+    def iter_source_files(self, lag_days: object = None) -> object:
+        """Yields the source data files for the processor dates, in date order.
         Adds previous n days of `lag_days` if not already in `self._dates`
             if lag_days>0.
         Adds next n days of `self._lead_time` if not already in `self._dates`
             if `self._lead_time`>0.
 
+        Files are yielded as soon as they are resolved, after the (possibly
+            cached) scan of the source tree, so callers can start on them
+            before all of the dates have been resolved.
+
         Args:
             lag_days: The number of lag days to include in the data processing.
 
-        Returns:
-            None. The method updates the `_var_files` attribute of the `Processor` object.
+        Yields:
+            Tuples of (variable name, file path) for each source file, once each.
 
         Raises:
             OSError: If the source data directory does not exist.
         """
-
         if not os.path.exists(self.source_data):
             raise OSError("Source data directory {} does not exist".format(
                 self.source_data))
 
-        var_files = {}
+        category_dates = {}
+        seen_files = set()
 
         for date_category in ["train", "val", "test"]:
-            dates = sorted(getattr(self._dates, date_category))
+            dates = set(getattr(self._dates, date_category))
 
             if dates:
-                logging.info("Processing {} dates for {} category".format(
-                    len(dates), date_category))
+                logging.info("Processing %d dates for %s category",
+                             len(dates), date_category)
             else:
-                logging.info(
-                    "No {} dates for this processor".format(date_category))
+                logging.info("No %s dates for this processor", date_category)
                 continue
 
-            # TODO: ProcessPool for this (avoid the GIL for globbing)
             # FIXME: needs to deal with a lack of continuity in the date ranges
             if lag_days:
-                logging.info("Including lag of {} days".format(lag_days))
+                logging.info("Including lag of %d days", lag_days)
 
-                additional_lag_dates = []
-
-                for date in dates:
-                    for day in range(lag_days):
-                        lag_date = date - dt.timedelta(days=day + 1)
-                        if lag_date not in dates:
-                            additional_lag_dates.append(lag_date)
-                dates += list(set(additional_lag_dates))
+                dates.update([
+                    date - dt.timedelta(days=day + 1)
+                    for date in dates
+                    for day in range(lag_days)
+                ])
 
             # FIXME: this is conveniently supplied for siconca_abs on
             #  training with OSISAF data, but are we exploiting the
             #  convenient usage of this data for linear trends?
             if self._lead_time:
-                logging.info("Including lead of {} days".format(
-                    self._lead_time))
+                logging.info("Including lead of %d days", self._lead_time)
+
+                dates.update([
+                    date + dt.timedelta(days=day + 1)
+                    for date in dates
+                    for day in range(self._lead_time)
+                ])
+
+            category_dates[date_category] = dates
+
+        # Walk the source tree once, only for the years we need, indexing
+        # the files by their date token
+        years = set([
+            date.strftime("%Y")
+            for dates in category_dates.values()
+            for date in dates
+        ])
+        logging.debug("Scanning %s for %d years", self.source_data, len(years))
+        source_files = collections.defaultdict(list)
+
+        for name, path in self._scan_source_data(years):
+            source_files[name[:-3]].append(path)
+
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Found %d files",
+                          sum(len(paths) for paths in source_files.values()))
+
+        for dates in category_dates.values():
+            # Ensure we're ordered, it has repercussions for xarray
+            for date in sorted(dates):
+                match_dfs = source_files.get(date.strftime("%Y"), [])
 
-                additional_lead_dates = []
+                if not match_dfs:
+                    logging.info(
+                        "No data found for %s, outside data boundary "
+                        "perhaps?", date.strftime("%Y-%m-%d"))
 
-                for date in dates:
-                    for day in range(self._lead_time):
-                        lead_day = date + dt.timedelta(days=day + 1)
-                        if lead_day not in dates:
-                            additional_lead_dates.append(lead_day)
-                dates += list(set(additional_lead_dates))
+                for df in match_dfs:
+                    sep_idx = df.rfind(os.sep)
 
-            globstr = "{}/**/[12]*.nc".format(self.source_data)
+                    if self._file_filter_re and \
+                            self._file_filter_re.search(df, sep_idx + 1):
+                        continue
 
-            logging.debug("Globbing {} from {}".format(date_category, globstr))
-            dfs = glob.glob(globstr, recursive=True)
-            logging.debug("Globbed {} files".format(len(dfs)))
+                    parent = df[:sep_idx]
+                    var = parent[parent.rfind(os.sep) + 1:]
 
-            # FIXME: using hyphens broadly no?
-            data_dates = [
-                df.split(os.sep)[-1][:-3].replace("_", "-") for df in dfs
-            ]
-            dt_series = pd.Series(dfs, index=data_dates)
+                    # The year is in the path, fall back one further
+                    if YEAR_DIR_RE.match(var):
+                        parent = parent[:-len(var) - 1]
+                        var = parent[parent.rfind(os.sep) + 1:]
 
-            logging.debug("Create structure of {} files".format(
-                len(dt_series)))
+                    if df not in seen_files:
+                        seen_files.add(df)
+                        yield var, df
 
-            # Ensure we're ordered, it has repercussions for xarray
-            for date in sorted(dates):
-                try:
-                    match_dfs = dt_series[date.strftime("%Y")]
+    def _scan_source_data(self, years: object) -> list:
+        """Scans the source data for the files of the given years.
 
-                    if type(match_dfs) == str:
-                        match_dfs = [match_dfs]
-                except KeyError:
-                    logging.info("No data found for {}, outside data boundary "
-                                 "perhaps?".format(date.strftime("%Y-%m-%d")))
-                    match_dfs = []
+        If enabled, the scan is cached on disk, keyed by the modification times
+            of the source data directory and its immediate (variable)
+            subdirectories, so repeated runs over an unchanged source tree skip
+            the walk. Files replaced deeper in the tree, without adding or
+            removing entries in those directories, will not invalidate the cache.
 
-                for df in match_dfs:
-                    if any([
-                            flt in os.path.split(df)[1]
-                            for flt in self._file_filters
-                    ]):
-                        continue
+        Args:
+            years: Year strings to restrict the scan to.
 
-                    path_comps = str(os.path.split(df)[0]).split(os.sep)
-                    var = path_comps[-1]
+        Returns:
+            A list of (file name, file path) tuples for each matching file.
+        """
+        if not self._scan_cache:
+            return _scan_nc_files(self.source_data, years, self._dir_cache)
 
-                    # The year is in the path, fall back one further
-                    if re.match(r'^\d{4}$', var):
-                        var = path_comps[-2]
+        dir_mtimes = [[self.source_data, os.stat(self.source_data).st_mtime_ns]]
 
-                    if var not in var_files.keys():
-                        var_files[var] = list()
+        with os.scandir(self.source_data) as entries:
+            dir_mtimes += sorted([[entry.path, entry.stat().st_mtime_ns]
+                                  for entry in entries
+                                  if entry.is_dir() and
+                                  not entry.name.startswith(".")])
 
-                    if df not in var_files[var]:
-                        var_files[var].append(df)
+        key = hashlib.sha1(
+            json.dumps([dir_mtimes, sorted(years)]).encode()).hexdigest()
+        # One cache file per source directory, so a new scan replaces the
+        # superseded one rather than adding to them
+        cache_path = os.path.join(
+            self.base_path, ".scan_cache", "{}.json".format(
+                hashlib.sha1(self.source_data.encode()).hexdigest()))
 
-        # TODO: allow option to ditch dates from train/val/test for missing
-        #  var files
-        self._var_files = {
-            var: var_files[var]
-            for var in sorted(var_files.keys())
-        }
-        for var in self._var_files.keys():
-            logging.info("Got {} files for {}".format(
-                len(self._var_files[var]), var))
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as fh:
+                cache = json.load(fh)
+
+            if cache["key"] == key:
+                logging.debug("Using cached scan %s", cache_path)
+                return [tuple(el) for el in cache["files"]]
+
+        # The tree may have changed since it was listed, so don't reuse the
+        # in memory listings either
+        self._dir_cache.clear()
+        files = _scan_nc_files(self.source_data, years, self._dir_cache)
+
+        if not self.dry:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+            with open(cache_path, "w") as fh:
+                json.dump(dict(key=key, files=files), fh)
+        return files
 
     @abstractmethod
     def process(self):
@@ -358,33 +550,60 @@ class Processor(DataProducer):
         raise NotImplementedError("{}.process is abstract".format(
             __class__.__name__))
 
-    def save_processed_file(self, var_name: str, name: str, data: object,
+    def save_processed_file(self,
+                            var_name: str,
+                            name: str,
+                            data: object,
+                            backend: str = "netcdf",
                             **kwargs) -> str:
-        """Save processed data to netCDF file.
+        """Save processed data to netCDF file, or optionally a Zarr store.
 
         Args:
             var_name: The name of the variable.
             name: The name of the file.
             data: The data to be saved.
+            backend (optional): Either "netcdf", or "zarr" to save a Zarr store
+                chunked by time step in place of the `.nc` file, which is
+                read in parallel by the data loaders. Defaults to "netcdf".
             **kwargs: Additional keyword arguments to be passed to the
                 `get_data_var_folder` method.
 
         Returns:
-            The path of the saved netCDF file.
+            The path of the saved file.
+
+        Raises:
+            ValueError: If the backend is not recognised.
         """
         file_path = os.path.join(self.get_data_var_folder(var_name, **kwargs),
                                  name)
-        data.to_netcdf(file_path)
+
+        if backend == "netcdf":
+            data.to_netcdf(file_path)
+        elif backend == "zarr":
+            file_path = "{}.zarr".format(os.path.splitext(file_path)[0])
+            # Named as to_netcdf would, so it opens as the same DataArray
+            ds = data.to_dataset(
+                name=data.name if data.name is not None else
+                "__xarray_dataarray_variable__")
+
+            if "time" in ds.dims:
+                ds = ds.chunk(dict(time=1))
+            ds.to_zarr(file_path, mode="w")
+        else:
+            raise ValueError("Unknown backend for processed files: {}".format(
+                backend))
 
         if var_name not in self._processed_files.keys():
             self._processed_files[var_name] = list()
 
-        if file_path not in self._processed_files[var_name]:
-            logging.debug("Adding {} file: {}".format(var_name, file_path))
+        # The set tests membership, the list keeps the order files were saved
+        if file_path not in self._processed_file_set:
+            logging.debug("Adding %s file: %s", var_name, file_path)
+            self._processed_file_set.add(file_path)
             self._processed_files[var_name].append(file_path)
         else:
-            logging.warning("{} already exists in {} processed list".format(
-                file_path, var_name))
+            logging.warning("%s already exists in %s processed list",
+                            file_path, var_name)
         return file_path
 
     @property
@@ -53,6 +53,7 @@ class Masks(Generator):
         self._dtype = dtype
         self._shape = data_shape
         self._region = (slice(None, None), slice(None, None))
+        self._active_cell_masks = dict()
 
         self.init_params()
 
@@ -158,7 +159,7 @@ class Masks(Generator):
 
                 logging.info("Saving {}".format(mask_path))
 
-                np.save(mask_path, max_extent_mask)
+                np.save(mask_path, max_extent_mask, allow_pickle=False)
 
                 land_mask_path = os.path.join(self.get_data_var_folder("masks"),
                                               Masks.LAND_MASK_FILENAME)
@@ -170,7 +171,7 @@ class Masks(Generator):
                                     reshape(*self._shape) >= 1
 
                     logging.info("Saving {}".format(land_mask_path))
-                    np.save(land_mask_path, land_mask)
+                    np.save(land_mask_path, land_mask, allow_pickle=False)
             else:
                 logging.info("Skipping {}, already exists".format(mask_path))
 
@@ -178,6 +179,7 @@ class Masks(Generator):
         if remove_temp_files:
             logging.info("Removing {}".format(siconca_folder))
             shutil.rmtree(siconca_folder)
+            self._var_folder_cache.discard(siconca_folder)
 
         if save_polarhole_masks and not self.south:
             # Generate the polar hole masks
@@ -197,12 +199,14 @@ class Masks(Generator):
                     self.get_data_var_folder("masks"),
                     "polarhole{}_mask.npy".format(i + 1))
                 logging.info("Saving polarhole {}".format(polarhole_path))
-                np.save(polarhole_path, polarhole)
+                np.save(polarhole_path, polarhole, allow_pickle=False)
 
     def get_active_cell_mask(self, month: object) -> object:
         """Loads an active grid cell mask from numpy file.
 
         Also, checks if a mask file exists for input month, and raises an error if it does not.
+        Loaded masks are cached (read-only) on the instance, as they are
+        requested repeatedly for the same months.
 
         Args:
             month: Month index representing the month for which the mask file is being checked.
@@ -213,17 +217,22 @@ class Masks(Generator):
         Raises:
             RuntimeError: If the mask file for the input month does not exist.
         """
-        mask_path = os.path.join(
-            self.get_data_var_folder("masks"),
-            "active_grid_cell_mask_{:02d}.npy".format(month))
+        if month not in self._active_cell_masks:
+            mask_path = os.path.join(
+                self.get_data_var_folder("masks"),
+                "active_grid_cell_mask_{:02d}.npy".format(month))
 
-        if not os.path.exists(mask_path):
-            raise RuntimeError("Active cell masks have not been generated, "
-                               "this is not done automatically so you might "
-                               "want to address this!")
+            if not os.path.exists(mask_path):
+                raise RuntimeError("Active cell masks have not been generated, "
+                                   "this is not done automatically so you "
+                                   "might want to address this!")
 
-        # logging.debug("Loading active cell mask {}".format(mask_path))
-        return np.load(mask_path)[self._region]
+            # logging.debug("Loading active cell mask {}".format(mask_path))
+            mask = np.load(mask_path)
+            mask.flags.writeable = False
+            self._active_cell_masks[month] = mask
+
+        return self._active_cell_masks[month][self._region]
 
     def get_active_cell_da(self, src_da: object) -> object:
         """Generate an xarray.DataArray object containing the active cell masks
@@ -237,11 +246,13 @@ class Masks(Generator):
             An xarray.DataArray containing active cell masks for each time
                 in source DataArray.
         """
+        months = pd.DatetimeIndex(src_da.time.values).month
+        month_masks = {
+            month: self.get_active_cell_mask(month) for month in set(months)
+        }
+
         return xr.DataArray(
-            [
-                self.get_active_cell_mask(pd.to_datetime(date).month)
-                for date in src_da.time.values
-            ],
+            np.stack([month_masks[month] for month in months]),
             dims=('time', 'yc', 'xc'),
             coords={
                 'time': src_da.time.values,
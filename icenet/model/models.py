@@ -228,8 +228,9 @@ def unet_batchnorm(input_shape: object,
                    padding='same',
                    kernel_initializer='he_normal')(conv9)
 
+    # The output stays float32 so mixed precision policies remain stable
     final_layer = Conv2D(n_forecast_days, kernel_size=1,
-                         activation='sigmoid')(conv9)
+                         activation='sigmoid', dtype='float32')(conv9)
 
     # Keras graph mode needs y_pred and y_true to have the same shape, so we
     #   we must pad an extra dimension onto the model output to train with
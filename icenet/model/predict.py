@@ -1,8 +1,13 @@
 import argparse
+import collections
 import datetime as dt
+import gc
 import logging
 import os
 import re
+import tempfile
+
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -17,67 +22,193 @@ from icenet.utils import setup_logging
 
 """
 
+DATE_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
 
 def predict_forecast(
     dataset_config: object,
     network_name: object,
     dataset_name: object = None,
+    generate_workers: int = 4,
+    jit_compile: bool = False,
     legacy_rounding: bool = False,
+    mixed_precision: bool = False,
     model_func: callable = models.unet_batchnorm,
     n_filters_factor: float = 1 / 8,
+    network: object = None,
     network_folder: object = None,
+    output_dtype: str = "float32",
     output_folder: object = None,
+    overwrite: bool = True,
+    prediction_batch_size: int = 8,
     save_args: bool = False,
     seed: int = 42,
+    single_file: bool = False,
     start_dates: object = tuple([dt.datetime.now().date()]),
     test_set: bool = False,
+    trt_precision: str = None,
 ) -> object:
     """
 
     :param dataset_config:
     :param network_name:
     :param dataset_name:
+    :param generate_workers: Threads generating input samples ahead of
+        inference
+    :param jit_compile: Compile the inference function with XLA
     :param legacy_rounding:
+    :param mixed_precision: Build the network with the mixed_float16 policy
     :param model_func:
     :param n_filters_factor:
+    :param network: Previously loaded network to use, for example from
+        load_network, to avoid rebuilding it across calls. It is left for
+        the caller to release
     :param network_folder:
+    :param output_dtype: Type predictions are stored as, float32, float16 or
+        uint8 (concentration quantised to 1/255 steps)
     :param output_folder:
+    :param overwrite: Predict dates even if they already have output,
+        otherwise they are skipped
+    :param prediction_batch_size: Number of dates per inference call
     :param save_args:
     :param seed:
+    :param single_file: Write all predictions to one compressed
+        forecasts.npz, keyed by date, rather than a file per date. Dates
+        already in an existing forecasts.npz are kept
     :param start_dates:
     :param test_set:
+    :param trt_precision: If set, convert the network with TF-TRT using
+        this precision mode (FP32 or FP16) for inference
     :return:
     """
+    start_dates = list(start_dates)
+    n_requested = len(start_dates)
+    npz_path = os.path.join(output_folder, "forecasts.npz")
+
+    if not overwrite:
+        if single_file:
+            existing_keys = set()
+
+            if os.path.exists(npz_path):
+                with np.load(npz_path) as npz_data:
+                    existing_keys = set(npz_data.files)
+            existing = set([
+                date for date in start_dates
+                if date.strftime("%Y_%m_%d") in existing_keys
+            ])
+        else:
+            existing = set([
+                date for date in start_dates if os.path.exists(
+                    os.path.join(output_folder, date.strftime("%Y_%m_%d.npy")))
+            ])
+
+        if len(existing) > 0:
+            logging.info("Skipping {} dates with existing output".format(
+                len(existing)))
+            start_dates = [
+                date for date in start_dates if date not in existing
+            ]
+
+    if len(start_dates) == 0:
+        if n_requested == 0:
+            logging.warning("No start dates provided, nothing to predict")
+        else:
+            logging.info("All {} requested dates already have output, "
+                         "nothing to predict".format(n_requested))
+        return
+
     # TODO: going to need to be able to handle merged datasets
     ds = IceNetDataSet(dataset_config)
     dl = ds.get_data_loader()
 
-    if not network_folder:
-        network_folder = os.path.join(".", "results", "networks", network_name)
+    release_network = network is None
 
-    dataset_name = dataset_name if dataset_name else ds.identifier
-    network_path = os.path.join(
-        network_folder, "{}.network_{}.{}.h5".format(network_name, dataset_name,
-                                                     seed))
+    if network is None:
+        if not network_folder:
+            network_folder = os.path.join(".", "results", "networks",
+                                          network_name)
 
-    logging.info("Loading model from {}...".format(network_path))
+        dataset_name = dataset_name if dataset_name else ds.identifier
+        network_path = os.path.join(
+            network_folder,
+            "{}.network_{}.{}.h5".format(network_name, dataset_name, seed))
 
-    network = model_func((*ds.shape, dl.num_channels), [], [],
-                         legacy_rounding=legacy_rounding,
-                         n_filters_factor=n_filters_factor,
-                         n_forecast_days=ds.n_forecast_days)
-    network.load_weights(network_path)
+        network = load_network(network_path, (*ds.shape, dl.num_channels),
+                               ds.n_forecast_days,
+                               legacy_rounding=legacy_rounding,
+                               mixed_precision=mixed_precision,
+                               model_func=model_func,
+                               n_filters_factor=n_filters_factor)
+
+    # A single concrete function, traced once for any batch size, is reused
+    # for every prediction rather than going through Keras' __call__
+    input_spec = tf.TensorSpec(shape=(None, *ds.shape, dl.num_channels),
+                               dtype=tf.float32)
+    infer = tf.function(lambda x: network(x, training=False),
+                        input_signature=[input_spec],
+                        jit_compile=jit_compile)
+
+    if trt_precision:
+        infer = _convert_trt(network, input_spec, trt_precision)
+
+    if os.path.exists(output_folder):
+        logging.warning("{} output already exists".format(output_folder))
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Outputs are written in the background, overlapping disk writes with
+    # the following predictions
+    save_executor = ThreadPoolExecutor(max_workers=2)
+    save_futures = []
+    outputs = dict() if single_file else None
 
     if not test_set:
         logging.info("Generating forecast inputs from processed/ files")
 
-        for date in start_dates:
-            data_sample = dl.generate_sample(date, prediction=True)
-            run_prediction(network=network,
-                           date=date,
-                           output_folder=output_folder,
-                           data_sample=data_sample,
-                           save_args=save_args)
+        # Samples are generated ahead in the background, so preparing the
+        # next batch overlaps with inference on the current one. Only two
+        # batches are generated ahead, bounding the samples held in memory
+        lookahead = 2 * prediction_batch_size
+
+        with ThreadPoolExecutor(max_workers=generate_workers) as executor:
+            pending = collections.deque([
+                executor.submit(dl.generate_sample, date, prediction=True)
+                for date in start_dates[:lookahead]
+            ])
+            next_idx = len(pending)
+
+            for i in range(0, len(start_dates), prediction_batch_size):
+                batch_dates = start_dates[i:i + prediction_batch_size]
+                data_samples = []
+
+                for _ in batch_dates:
+                    data_samples.append(pending.popleft().result())
+
+                    if next_idx < len(start_dates):
+                        pending.append(
+                            executor.submit(dl.generate_sample,
+                                            start_dates[next_idx],
+                                            prediction=True))
+                        next_idx += 1
+
+                net_inputs = np.stack([sample[0] for sample in data_samples])
+
+                logging.info("Running prediction for {} dates".format(
+                    len(batch_dates)))
+                preds = infer(
+                    tf.convert_to_tensor(
+                        net_inputs.astype(np.float32, copy=False))).numpy()
+
+                for j, (date, data_sample) in enumerate(
+                        zip(batch_dates, data_samples)):
+                    save_futures.append(
+                        save_executor.submit(_save_prediction,
+                                             pred=preds[j:j + 1],
+                                             date=date,
+                                             output_folder=output_folder,
+                                             data_sample=data_sample,
+                                             save_args=save_args,
+                                             output_dtype=output_dtype,
+                                             outputs=outputs))
     else:
         # TODO: This is horrible behaviour, rethink and refactor: we should
         #  be able to pull from the test set in a nicer and more efficient
@@ -86,58 +217,230 @@ def predict_forecast(
 
         source_key = [k for k in dl.config['sources'].keys() if k != "meta"][0]
         # FIXME: should be using date format from class
-        test_dates = [
-            dt.date(*[int(v)
-                      for v in d.split("_")])
-            for d in dl.config["sources"][source_key]["dates"]["test"]
-        ]
+        test_date_idx = {
+            dt.date(*map(int, d.split("_"))): i
+            for i, d in enumerate(
+                dl.config["sources"][source_key]["dates"]["test"])
+        }
 
-        if len(test_dates) == 0:
+        if len(test_date_idx) == 0:
             raise RuntimeError("No processed files were produced for the test "
                                "set")
 
-        missing = set(start_dates).difference(test_dates)
+        missing = set(start_dates).difference(test_date_idx.keys())
         if len(missing) > 0:
             raise RuntimeError("{} are not in the test set".format(", ".join(
                 [str(pd.to_datetime(el).date()) for el in missing])))
 
-        data_iter = test_inputs.as_numpy_iterator()
-        # FIXME: this is broken, this entry never gets added to the set?
-        data = next(data_iter)
-        x, y, sw = data
-        batch = 0
-
-        for i, idx in enumerate([test_dates.index(sd) for sd in start_dates]):
-            while batch < int(idx / ds.batch_size):
-                data = next(data_iter)
-                x, y, sw = data
-                batch += 1
-            arr_idx = idx % ds.batch_size
-            logging.info("Processing test batch {}, item {} (date {})".format(
-                batch + 1, arr_idx, test_dates[idx]))
-
-            run_prediction(network=network,
-                           date=test_dates[idx],
-                           output_folder=output_folder,
-                           data_sample=(x[arr_idx, ...],
-                                        y[arr_idx, ...],
-                                        sw[arr_idx, ...]),
-                           save_args=save_args)
-
-
-def run_prediction(network, date, output_folder, data_sample, save_args):
+        # Group the requested items by batch, so that a single pass over the
+        # test set, which can only be read sequentially, handles each batch
+        # we need once and stops after the last of them
+        batch_items = dict()
+        for date in start_dates:
+            idx = test_date_idx[date]
+            batch_items.setdefault(idx // ds.batch_size, []).append(
+                (date, idx % ds.batch_size))
+        last_batch_id = max(batch_items.keys())
+
+        for batch_id, (x, y, sw) in enumerate(
+                test_inputs.as_numpy_iterator()):
+            if batch_id > last_batch_id:
+                break
+
+            for date, arr_idx in batch_items.get(batch_id, []):
+                logging.info("Processing test batch {}, item {} (date {})".
+                             format(batch_id + 1, arr_idx, date))
+
+                save_futures.append(
+                    run_prediction(infer=infer,
+                                   date=date,
+                                   output_folder=output_folder,
+                                   data_sample=(x[arr_idx, ...],
+                                                y[arr_idx, ...],
+                                                sw[arr_idx, ...]),
+                                   save_args=save_args,
+                                   executor=save_executor,
+                                   output_dtype=output_dtype,
+                                   outputs=outputs))
+
+    # Wait for outstanding writes, raising any failures
+    for future in save_futures:
+        future.result()
+    save_executor.shutdown()
+
+    if single_file:
+        # Keep the forecasts of earlier runs, as per date files would be,
+        # with those predicted now replacing any for the same dates
+        if os.path.exists(npz_path):
+            with np.load(npz_path) as npz_data:
+                for key in npz_data.files:
+                    if key not in outputs:
+                        outputs[key] = npz_data[key]
+
+        logging.info("Saving {} forecasts to {}".format(
+            len(outputs), npz_path))
+        np.savez_compressed(npz_path, **outputs)
+
+    del infer
+
+    # Release the network so callers in the same process get the memory back
+    if release_network:
+        del network
+        tf.keras.backend.clear_session()
+        gc.collect()
+
+
+def load_network(network_path: str,
+                 input_shape: tuple,
+                 n_forecast_days: int,
+                 legacy_rounding: bool = False,
+                 mixed_precision: bool = False,
+                 model_func: callable = models.unet_batchnorm,
+                 n_filters_factor: float = 1 / 8) -> object:
+    """Builds the network and loads its weights
+
+    The result can be passed to predict_forecast repeatedly, so that the
+    network is only constructed and loaded once.
+
+    :param network_path: Path to the saved network weights
+    :param input_shape: Shape of a single input sample, including channels
+    :param n_forecast_days:
+    :param legacy_rounding:
+    :param mixed_precision: Build the network with the mixed_float16 policy
+    :param model_func:
+    :param n_filters_factor:
+    :return: The loaded network
+    """
+    logging.info("Loading model from {}...".format(network_path))
+
+    global_policy = tf.keras.mixed_precision.global_policy()
+
+    if mixed_precision:
+        logging.info("Using mixed_float16 precision policy")
+        tf.keras.mixed_precision.set_global_policy("mixed_float16")
+
+    network = model_func(input_shape, [], [],
+                         legacy_rounding=legacy_rounding,
+                         n_filters_factor=n_filters_factor,
+                         n_forecast_days=n_forecast_days)
+    # Layers keep the policy they were built with, so don't leak ours
+    tf.keras.mixed_precision.set_global_policy(global_policy)
+    network.load_weights(network_path)
+
+    return network
+
+
+def _convert_trt(network: object, input_spec: object,
+                 precision: str) -> callable:
+    """Converts the network with TF-TRT, returning an inference function
+
+    TensorRT engines are built lazily on first call for the shapes seen, so
+    no representative input is needed for the supported precisions.
+
+    :param network: Loaded keras model
+    :param input_spec: TensorSpec describing the network input
+    :param precision: TensorRT precision mode, FP32 or FP16
+    :return: Function taking a batch of inputs, returning predictions
+    """
+    from tensorflow.python.compiler.tensorrt import trt_convert as trt
+
+    serving_fn = tf.function(lambda x: network(x, training=False),
+                             input_signature=[input_spec])
+
+    with tempfile.TemporaryDirectory() as saved_model_dir:
+        logging.info("Converting network to TF-TRT ({})".format(precision))
+        tf.saved_model.save(network,
+                            saved_model_dir,
+                            signatures=serving_fn.get_concrete_function())
+
+        converter = trt.TrtGraphConverterV2(
+            input_saved_model_dir=saved_model_dir,
+            precision_mode=precision)
+        trt_fn = converter.convert()
+
+    input_name = list(trt_fn.structured_input_signature[1].keys())[0]
+
+    def infer(x):
+        return list(trt_fn(**{input_name: x}).values())[0]
+
+    return infer
+
+
+def run_prediction(infer,
+                   date,
+                   output_folder,
+                   data_sample,
+                   save_args,
+                   executor=None,
+                   output_dtype="float32",
+                   outputs=None):
+    """
+
+    :param infer: Inference function, or network, taking a batch of inputs
+    :param date:
+    :param output_folder: Existing folder to save the output to
+    :param data_sample:
+    :param save_args:
+    :param executor: If provided, the output is saved asynchronously using
+        this executor and a future for the output path is returned
+    :param output_dtype:
+    :param outputs: If provided, the output is stored in this dict rather
+        than saved to its own file
+    :return:
+    """
     net_input, net_output, sample_weights = data_sample
 
     logging.info("Running prediction {}".format(date))
-    pred = network(tf.convert_to_tensor([net_input]), training=False)
+    batch_input = net_input[np.newaxis, ...].astype(np.float32, copy=False)
+    pred = infer(tf.convert_to_tensor(batch_input))
+
+    save_kwargs = dict(pred=pred.numpy(),
+                       date=date,
+                       output_folder=output_folder,
+                       data_sample=data_sample,
+                       save_args=save_args,
+                       output_dtype=output_dtype,
+                       outputs=outputs)
+
+    if executor is not None:
+        return executor.submit(_save_prediction, **save_kwargs)
+    return _save_prediction(**save_kwargs)
+
+
+def _save_prediction(pred,
+                     date,
+                     output_folder,
+                     data_sample,
+                     save_args,
+                     output_dtype="float32",
+                     outputs=None):
+    """
 
-    if os.path.exists(output_folder):
-        logging.warning("{} output already exists".format(output_folder))
-    os.makedirs(output_folder, exist_ok=output_folder)
+    :param pred:
+    :param date:
+    :param output_folder:
+    :param data_sample:
+    :param save_args:
+    :param output_dtype:
+    :param outputs:
+    :return:
+    """
     output_path = os.path.join(output_folder, date.strftime("%Y_%m_%d.npy"))
 
-    logging.info("Saving {} - forecast output {}".format(date, pred.shape))
-    np.save(output_path, pred)
+    if output_dtype == "uint8":
+        # Decoded back to fractions by icenet.process.predict
+        pred = np.round(np.clip(pred, 0., 1.) * 255).astype(np.uint8)
+    else:
+        pred = pred.astype(output_dtype, copy=False)
+
+    if outputs is not None:
+        logging.info("Storing {} - forecast output {} ({})".format(
+            date, pred.shape, pred.dtype))
+        outputs[date.strftime("%Y_%m_%d")] = pred
+    else:
+        logging.info("Saving {} - forecast output {} ({})".format(
+            date, pred.shape, pred.dtype))
+        np.save(output_path, pred, allow_pickle=False)
 
     if save_args:
         logging.debug("Saving loader generated data for reference...")
@@ -152,8 +455,8 @@ def date_arg(string: str) -> object:
     :param string:
     :return:
     """
-    date_match = re.search(r"(\d{4})-(\d{1,2})-(\d{1,2})", string)
-    return dt.date(*[int(s) for s in date_match.groups()])
+    date_match = DATE_PATTERN.search(string)
+    return dt.date(*map(int, date_match.groups()))
 
 
 @setup_logging
@@ -175,11 +478,46 @@ def get_args():
                     help="Train dataset identifier",
                     type=str,
                     default=None)
+    ap.add_argument("-m", "--mixed-precision", action="store_true",
+                    default=False,
+                    help="Run inference using the mixed_float16 policy")
     ap.add_argument("-n", "--n-filters-factor", type=float, default=1.)
+    ap.add_argument("-j", "--jit-compile", action="store_true",
+                    default=False, help="Compile inference with XLA")
     ap.add_argument("-l", "--legacy-rounding", action="store_true",
                     default=False, help="Ensure filter number rounding occurs last in channel number calculations")
+    ap.add_argument("-o",
+                    "--output-dtype",
+                    choices=("float32", "float16", "uint8"),
+                    default="float32",
+                    help="Type to store predictions as")
+    ap.add_argument("-ow",
+                    "--overwrite",
+                    help="Predict dates that already have output",
+                    action="store_true",
+                    default=False)
+    ap.add_argument("-pb",
+                    "--prediction-batch-size",
+                    dest="batch_size",
+                    help="Number of dates predicted per network call",
+                    type=int,
+                    default=8)
+    ap.add_argument("-sf",
+                    "--single-file",
+                    help="Write all forecasts to a single compressed file",
+                    action="store_true",
+                    default=False)
     ap.add_argument("-t", "--testset", action="store_true", default=False)
+    ap.add_argument("--trt-precision",
+                    choices=("FP32", "FP16"),
+                    default=None,
+                    help="Convert the network with TF-TRT for inference")
     ap.add_argument("-v", "--verbose", action="store_true", default=False)
+    ap.add_argument("-w",
+                    "--workers",
+                    help="Number of threads generating input samples",
+                    type=int,
+                    default=4)
     ap.add_argument("-s", "--save_args", action="store_true", default=False)
 
     return ap.parse_args()
@@ -192,9 +530,8 @@ def main():
         os.path.join(".", "dataset_config.{}.json".format(args.dataset))
 
     date_content = args.datefile.read()
-    dates = [
-        dt.date(*[int(v) for v in s.split("-")]) for s in date_content.split()
-    ]
+    dates = list(
+        pd.to_datetime(date_content.split(), format="%Y-%m-%d").date)
     args.datefile.close()
 
     output_folder = os.path.join(".", "results", "predict", args.output_name,
@@ -207,10 +544,18 @@ def main():
         #  do we need to retain the train SD name in the
         #  network?
         dataset_name=args.ident if args.ident else args.dataset,
+        generate_workers=args.workers,
+        jit_compile=args.jit_compile,
         legacy_rounding=args.legacy_rounding,
+        mixed_precision=args.mixed_precision,
         n_filters_factor=args.n_filters_factor,
+        output_dtype=args.output_dtype,
         output_folder=output_folder,
+        overwrite=args.overwrite,
+        prediction_batch_size=args.batch_size,
         save_args=args.save_args,
         seed=args.seed,
+        single_file=args.single_file,
         start_dates=dates,
-        test_set=args.testset)
+        test_set=args.testset,
+        trt_precision=args.trt_precision)
@@ -6,18 +6,18 @@ import sys
 
 from datetime import timedelta
 
+import dask
 import matplotlib as mpl
 import matplotlib.cm as cm
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FFMpegWriter
 from matplotlib.backends.backend_pdf import PdfPages
 
 import seaborn as sns
 
 import numpy as np
 import pandas as pd
-import dask.array as da
 import xarray as xr
 
 from icenet import __version__ as icenet_version
@@ -26,10 +26,17 @@ from icenet.data.sic.mask import Masks
 from icenet.plotting.utils import (filter_ds_by_obs, get_forecast_ds,
                                    get_obs_da, get_seas_forecast_da,
                                    get_seas_forecast_init_dates, show_img,
-                                   get_plot_axes, process_probes,
-                                   process_regions)
+                                   get_plot_axes, load_in_memory,
+                                   process_probes, process_regions)
 from icenet.plotting.video import xarray_to_video
 
+numba_available = False
+try:
+    from numba import njit, prange
+    numba_available = True
+except ModuleNotFoundError:
+    pass
+
 
 def parse_location_or_region(argument: str):
     separator = ','
@@ -63,6 +70,152 @@ def region_arg(argument: str):
             "Region argument must be list of four integers")
 
 
+def _get_metric_arrays(masks: object, fc_da: object, obs_da: object) -> tuple:
+    """
+    Aligns a forecast with the observations and extracts the underlying
+    (time, yc, xc) arrays, along with the active grid cell mask, so metrics
+    can be computed directly with NumPy rather than via xarray reductions.
+
+    :param masks: an icenet Masks object
+    :param fc_da: the forecasts given as an xarray.DataArray object
+                  with time, xc, yc coordinates
+    :param obs_da: the "ground truth" given as an xarray.DataArray object
+                   with time, xc, yc coordinates
+
+    :return: tuple of (forecast array, observation array,
+                       active grid cell mask array, time coordinate)
+    """
+    fc_da, obs_da = xr.align(fc_da, obs_da)
+    agcm = masks.get_active_cell_da(obs_da)
+
+    dims = ("time", "yc", "xc")
+    return (fc_da.transpose(*dims).values, obs_da.transpose(*dims).values,
+            agcm.transpose(*dims).values, obs_da.time)
+
+
+def _threshold_count(arr: object, threshold: float, mask: object) -> object:
+    """
+    Counts, for each time step, the masked grid cells exceeding a threshold.
+
+    :param arr: array with (time, yc, xc) dimensions
+    :param threshold: the threshold to exceed
+    :param mask: boolean array with the same dimensions as arr
+
+    :return: array of counts with a time dimension
+    """
+    return np.count_nonzero(np.logical_and(arr > threshold, mask),
+                            axis=(-2, -1))
+
+
+def _check_threshold(threshold: float) -> float:
+    """
+    Validates a SIC threshold, defaulting to 15%.
+
+    :param threshold: the SIC threshold of interest (in percentage as a fraction),
+                      or None for the default
+
+    :return: the threshold, between 0 and 1
+    """
+    threshold = 0.15 if threshold is None else threshold
+    if (threshold < 0) or (threshold > 1):
+        raise ValueError("threshold must be a float between 0 and 1")
+    return threshold
+
+
+def _binary_accuracy_numpy(fc: object, binary_obs: object, agcm: object,
+                           threshold: float) -> object:
+    """
+    Computes the binary accuracy (in percent) over the masked grid cells for
+    each time step.
+
+    :param fc: forecast array with (time, yc, xc) dimensions
+    :param binary_obs: boolean array with (time, yc, xc) dimensions of where
+                       the observations exceed the threshold
+    :param agcm: boolean array with (time, yc, xc) dimensions
+    :param threshold: the SIC threshold of interest
+
+    :return: array of binary accuracies with a time dimension
+    """
+    # integer counts of the correct classifications within the active grid
+    # cell mask, with the boolean grid reused in place for each step
+    match = np.greater(fc, threshold)
+    np.equal(match, binary_obs, out=match)
+    np.logical_and(match, agcm, out=match)
+    return np.count_nonzero(match, axis=(-2, -1)) / \
+        np.count_nonzero(agcm, axis=(-2, -1)) * 100
+
+
+if numba_available:
+    _binary_accuracy_signatures = [
+        "float64[:]({0}[:, :, :], boolean[:, :, :], boolean[:, :, :], {0})".
+        format(dtype) for dtype in ("float32", "float64")
+    ]
+
+    @njit(_binary_accuracy_signatures,
+          parallel=True,
+          cache=True,
+          error_model="numpy")
+    def _binary_accuracy_numba(fc, binary_obs, agcm, threshold):
+        n_time, n_y, n_x = fc.shape
+        binacc = np.empty(n_time)
+
+        for t in prange(n_time):
+            n_match = 0
+            n_active = 0
+
+            for i in range(n_y):
+                for j in range(n_x):
+                    if agcm[t, i, j]:
+                        n_active += 1
+
+                        if (fc[t, i, j] > threshold) == binary_obs[t, i, j]:
+                            n_match += 1
+
+            binacc[t] = n_match / n_active * 100
+
+        return binacc
+
+
+def _binary_accuracy(fc_da: object, binary_obs_da: object, agcm_da: object,
+                     threshold: float) -> object:
+    """
+    Computes the binary class accuracy of a forecast against observations
+    which have already been classified, so the observation side can be
+    shared between forecasts. Uses numba, if available, to do so in a
+    single parallel pass over the arrays.
+
+    :param fc_da: the forecasts given as an xarray.DataArray object
+                  with time, xc, yc coordinates
+    :param binary_obs_da: an xarray.DataArray object of where the "ground
+                          truth" exceeds the threshold
+    :param agcm_da: an xarray.DataArray object of the active grid cell
+                    masks for the "ground truth"
+    :param threshold: the SIC threshold of interest (in percentage as a fraction)
+
+    :return: binary accuracy for forecast as xarray.DataArray object
+    """
+    fc_da, binary_obs_da, agcm_da = xr.align(fc_da, binary_obs_da, agcm_da)
+
+    dims = ("time", "yc", "xc")
+    # a common float type, matching the compiled numba signatures
+    fc = fc_da.transpose(*dims).values
+    fc = fc.astype(np.result_type(fc, np.float32), copy=False)
+    binary_obs = binary_obs_da.transpose(*dims).values.astype(
+        bool, copy=False)
+    agcm = agcm_da.transpose(*dims).values.astype(bool, copy=False)
+
+    if numba_available:
+        # the threshold in the forecast precision, as NumPy compares it
+        binacc = _binary_accuracy_numba(fc, binary_obs, agcm,
+                                        fc.dtype.type(threshold))
+    else:
+        binacc = _binary_accuracy_numpy(fc, binary_obs, agcm, threshold)
+
+    return xr.DataArray(binacc,
+                        dims=("time",),
+                        coords=dict(time=binary_obs_da.time))
+
+
 def compute_binary_accuracy(masks: object, fc_da: object, obs_da: object,
                             threshold: float) -> object:
     """
@@ -81,25 +234,10 @@ def compute_binary_accuracy(masks: object, fc_da: object, obs_da: object,
 
     :return: binary accuracy for forecast as xarray.DataArray object
     """
-    threshold = 0.15 if threshold is None else threshold
-    if (threshold < 0) or (threshold > 1):
-        raise ValueError("threshold must be a float between 0 and 1")
-
-    # obtain mask
-    agcm = masks.get_active_cell_da(obs_da)
-
-    # binary for observed (i.e. truth)
-    binary_obs_da = obs_da > threshold
-
-    # binary for forecast
-    binary_fc_da = fc_da > threshold
+    threshold = _check_threshold(threshold)
 
-    # compute binary accuracy metric
-    binary_fc_da = (binary_fc_da == binary_obs_da). \
-        astype(np.float16).weighted(agcm)
-    binacc_fc = (binary_fc_da.mean(dim=['yc', 'xc']) * 100)
-
-    return binacc_fc
+    return _binary_accuracy(fc_da, obs_da > threshold,
+                            masks.get_active_cell_da(obs_da), threshold)
 
 
 def plot_binary_accuracy(masks: object,
@@ -129,20 +267,21 @@ def plot_binary_accuracy(masks: object,
     :return: tuple of (binary accuracy for forecast (fc_da),
                        binary accuracy for comparison (cmp_da))
     """
-    binacc_fc = compute_binary_accuracy(masks=masks,
-                                        fc_da=fc_da,
-                                        obs_da=obs_da,
-                                        threshold=threshold)
+    threshold = _check_threshold(threshold)
+
+    # the observations are classified once, for both forecasts
+    binary_obs_da = obs_da > threshold
+    agcm_da = masks.get_active_cell_da(obs_da)
+
+    binacc_fc = _binary_accuracy(fc_da, binary_obs_da, agcm_da, threshold)
     fig, ax = plt.subplots(figsize=(12, 6))
     ax.set_title(
         f"Binary accuracy comparison (threshold SIC = {threshold*100}%)")
     ax.plot(binacc_fc.time, binacc_fc.values, label="IceNet")
 
     if cmp_da is not None:
-        binacc_cmp = compute_binary_accuracy(masks=masks,
-                                             fc_da=cmp_da,
-                                             obs_da=obs_da,
-                                             threshold=threshold)
+        binacc_cmp = _binary_accuracy(cmp_da, binary_obs_da, agcm_da,
+                                      threshold)
         ax.plot(binacc_cmp.time, binacc_cmp.values, label="SEAS")
     else:
         binacc_cmp = None
@@ -183,27 +322,18 @@ def compute_sea_ice_extent_error(masks: object, fc_da: object, obs_da: object,
     :return: SIE error for forecast as xarray.DataArray object
     """
     grid_area_size = 25 if grid_area_size is None else grid_area_size
-    threshold = 0.15 if threshold is None else threshold
-    if (threshold < 0) or (threshold > 1):
-        raise ValueError("threshold must be a float between 0 and 1")
+    threshold = _check_threshold(threshold)
 
-    # obtain mask
-    agcm = masks.get_active_cell_da(obs_da)
+    fc, obs, agcm, time = _get_metric_arrays(masks, fc_da, obs_da)
 
-    # binary for observed (i.e. truth)
-    binary_obs_da = obs_da > threshold
-    binary_obs_weighted_da = binary_obs_da.astype(int).weighted(agcm)
-
-    # binary for forecast
-    binary_fc_da = fc_da > threshold
-    binary_fc_weighted_da = binary_fc_da.astype(int).weighted(agcm)
-
-    # sie error
-    forecast_sie_error = (binary_fc_weighted_da.sum(['xc', 'yc']) -
-                          binary_obs_weighted_da.sum(['xc', 'yc'])) * (
+    # sie error, from the number of active cells exceeding the threshold
+    forecast_sie_error = (_threshold_count(fc, threshold, agcm) -
+                          _threshold_count(obs, threshold, agcm)) * (
                               grid_area_size**2)
 
-    return forecast_sie_error
+    return xr.DataArray(forecast_sie_error,
+                        dims=("time",),
+                        coords=dict(time=time))
 
 
 def plot_sea_ice_extent_error(masks: object,
@@ -272,6 +402,109 @@ def plot_sea_ice_extent_error(masks: object,
     return forecast_sie_error, cmp_sie_error
 
 
+def _metric_reduce_numpy(fc: object, obs: object, mask: object,
+                         need_abs: bool, need_sq: bool) -> tuple:
+    """
+    Computes the mean absolute and mean squared SIC error (in percent) over
+    the masked grid cells for each time step. NaN errors are ignored, as
+    with xarray's weighted mean.
+
+    :param fc: forecast array with (time, yc, xc) dimensions
+    :param obs: observation array with (time, yc, xc) dimensions
+    :param mask: boolean array with (time, yc, xc) dimensions
+    :param need_abs: whether to compute the MAE, otherwise it is all NaN
+    :param need_sq: whether to compute the MSE, otherwise it is all NaN
+
+    :return: tuple of (MAE, MSE) arrays with a time dimension
+    """
+    err = (fc - obs) * 100
+    valid = np.logical_and(mask, ~np.isnan(err))
+    err = np.where(valid, err, 0)
+    n_valid = valid.sum(axis=(-2, -1))
+    mae = np.abs(err).sum(axis=(-2, -1)) / n_valid \
+        if need_abs else np.full(n_valid.shape, np.nan)
+    mse = (err * err).sum(axis=(-2, -1)) / n_valid \
+        if need_sq else np.full(n_valid.shape, np.nan)
+    return mae, mse
+
+
+if numba_available:
+    # Explicit signatures compile eagerly, and with cache=True the compiled
+    # kernels are written to __pycache__ (or NUMBA_CACHE_DIR, if set, for
+    # read-only installs), so only the first ever import pays the JIT cost
+    _metric_reduce_signatures = [
+        "UniTuple(float64[:], 2)"
+        "({0}[:, :, :], {0}[:, :, :], boolean[:, :, :], boolean, boolean)".
+        format(dtype) for dtype in ("float32", "float64")
+    ]
+
+    @njit(_metric_reduce_signatures,
+          parallel=True,
+          cache=True,
+          error_model="numpy",
+          fastmath={"contract", "reassoc"})
+    def _metric_reduce_numba(fc, obs, mask, need_abs, need_sq):
+        n_time, n_y, n_x = fc.shape
+        mae = np.empty(n_time)
+        mse = np.empty(n_time)
+
+        for t in prange(n_time):
+            abs_sum = 0.
+            sq_sum = 0.
+            n_valid = 0.
+
+            for i in range(n_y):
+                for j in range(n_x):
+                    if mask[t, i, j]:
+                        err = (fc[t, i, j] - obs[t, i, j]) * 100.
+
+                        if not np.isnan(err):
+                            if need_abs:
+                                abs_sum += abs(err)
+                            if need_sq:
+                                sq_sum += err * err
+                            n_valid += 1.
+
+            mae[t] = abs_sum / n_valid if need_abs else np.nan
+            mse[t] = sq_sum / n_valid if need_sq else np.nan
+
+        return mae, mse
+
+
+def _metric_reduce(fc: object,
+                   obs: object,
+                   mask: object,
+                   need_abs: bool = True,
+                   need_sq: bool = True) -> tuple:
+    """
+    Computes the mean absolute and mean squared SIC error over the trailing
+    (yc, xc) dimensions, using numba if available. Only the accumulators
+    that are needed are computed, the other result is all NaN.
+
+    :param fc: forecast array with trailing (yc, xc) dimensions
+    :param obs: observation array with trailing (yc, xc) dimensions
+    :param mask: boolean array with trailing (yc, xc) dimensions
+    :param need_abs: whether to compute the MAE
+    :param need_sq: whether to compute the MSE
+
+    :return: tuple of (MAE, MSE) arrays without the (yc, xc) dimensions
+    """
+    # a common float type, matching the compiled numba signatures
+    dtype = np.result_type(fc, obs, np.float32)
+    fc, obs, mask = np.broadcast_arrays(fc.astype(dtype, copy=False),
+                                        obs.astype(dtype, copy=False),
+                                        mask.astype(bool, copy=False))
+    shape = fc.shape[:-2]
+    fc, obs, mask = [
+        arr.reshape(-1, *arr.shape[-2:]) for arr in (fc, obs, mask)
+    ]
+
+    reduce_func = _metric_reduce_numba \
+        if numba_available else _metric_reduce_numpy
+    mae, mse = reduce_func(fc, obs, mask, need_abs, need_sq)
+    return mae.reshape(shape), mse.reshape(shape)
+
+
 def compute_metrics(metrics: object, masks: object, fc_da: object,
                     obs_da: object) -> object:
     """
@@ -295,35 +528,28 @@ def compute_metrics(metrics: object, masks: object, fc_da: object,
                 f"{metric} metric has not been implemented. "
                 f"Please only choose out of {implemented_metrics}.")
 
-    # obtain mask
+    fc_da, obs_da = xr.align(fc_da, obs_da)
     mask_da = masks.get_active_cell_da(obs_da)
 
-    metric_dict = {}
-    # compute raw error
-    err_da = (fc_da - obs_da) * 100
-    if "mae" in metrics:
-        # compute absolute SIC errors
-        abs_err_da = da.fabs(err_da)
-        abs_weighted_da = abs_err_da.weighted(mask_da)
-    if "mse" in metrics or "rmse" in metrics:
-        # compute squared SIC errors
-        square_err_da = err_da**2
-        square_weighted_da = square_err_da.weighted(mask_da)
+    # all metrics are derived from a single fused pass over the SIC errors,
+    # applied chunk by chunk for dask-backed inputs, which only accumulates
+    # what the requested metrics need
+    need_abs = "mae" in metrics
+    need_sq = "mse" in metrics or "rmse" in metrics
+    mae_da, mse_da = xr.apply_ufunc(_metric_reduce,
+                                    fc_da,
+                                    obs_da,
+                                    mask_da,
+                                    kwargs=dict(need_abs=need_abs,
+                                                need_sq=need_sq),
+                                    input_core_dims=[["yc", "xc"]] * 3,
+                                    output_core_dims=[[], []],
+                                    dask="parallelized",
+                                    output_dtypes=[np.float64, np.float64])
+    metric_dict = dict(mae=mae_da, mse=mse_da)
+    if "rmse" in metrics:
+        metric_dict["rmse"] = np.sqrt(mse_da)
 
-    for metric in metrics:
-        if metric == "mae":
-            metric_dict[metric] = abs_weighted_da.mean(dim=['yc', 'xc'])
-        elif metric == "mse":
-            if "mse" not in metric_dict.keys():
-                # might've already been computed if RMSE came first
-                metric_dict["mse"] = square_weighted_da.mean(dim=['yc', 'xc'])
-        elif metric == "rmse":
-            if "mse" not in metric_dict.keys():
-                # check if MSE already been computed
-                metric_dict["mse"] = square_weighted_da.mean(dim=['yc', 'xc'])
-            metric_dict[metric] = da.sqrt(metric_dict["mse"])
-
-    # only return metrics requested (might've computed MSE when computing RMSE)
     return {k: metric_dict[k] for k in metrics}
 
 
@@ -369,9 +595,10 @@ def plot_metrics(metrics: object,
         cmp_metric_dict = None
 
     if separate:
-        # produce separate plots for each metric
+        # produce separate plots for each metric, reusing a single figure
+        fig, ax = plt.subplots(figsize=(12, 6))
         for metric in metrics:
-            fig, ax = plt.subplots(figsize=(12, 6))
+            ax.cla()
             ax.set_title(f"{metric.upper()} comparison")
             ax.plot(fc_metric_dict[metric].time,
                     fc_metric_dict[metric].values,
@@ -390,7 +617,8 @@ def plot_metrics(metrics: object,
             outpath = os.path.join("plot", f"{metric}.png") \
                 if not output_path else os.path.join(output_path, f"{metric}.png")
             logging.info(f"Saving to {outpath}")
-            plt.savefig(outpath)
+            fig.savefig(outpath, bbox_inches=None)
+        plt.close(fig)
     else:
         # produce one plot for all metrics
         fig, ax = plt.subplots(figsize=(12, 6))
@@ -1107,17 +1335,27 @@ def sic_error_video(fc_da: object, obs_da: object, land_mask: object,
     :param land_mask:
     :param output_path:
 
-    :return: matplotlib animation
+    :return: path of the saved video
     """
 
-    diff = fc_da - obs_da
+    # materialise the frames once, so each update is just array indexing
+    fc_da, obs_da = xr.align(fc_da, obs_da)
+    dims = ("time", "yc", "xc")
+    fc_arr = np.ascontiguousarray(fc_da.transpose(*dims).values,
+                                  dtype=np.float32)
+    obs_arr = np.ascontiguousarray(obs_da.transpose(*dims).values,
+                                   dtype=np.float32)
+    diff_arr = fc_arr - obs_arr
+    fc_labels = pd.DatetimeIndex(fc_da.time.values).strftime("%d/%m/%Y")
+    obs_labels = pd.DatetimeIndex(obs_da.time.values).strftime("%d/%m/%Y")
+
     fig, maps = plt.subplots(nrows=1, ncols=3, figsize=(16, 6), layout="tight")
     fig.set_dpi(150)
 
     leadtime = 0
-    fc_plot = fc_da.isel(time=leadtime).to_numpy()
-    obs_plot = obs_da.isel(time=leadtime).to_numpy()
-    diff_plot = diff.isel(time=leadtime).to_numpy()
+    fc_plot = fc_arr[leadtime]
+    obs_plot = obs_arr[leadtime]
+    diff_plot = diff_arr[leadtime]
 
     upper_bound = np.max(
         [np.abs(np.min(diff_plot)),
@@ -1138,14 +1376,8 @@ def sic_error_video(fc_da: object, obs_da: object, land_mask: object,
                          vmax=diff_vmax,
                          cmap=diff_cmap)
 
-    tic = maps[0].set_title(
-        "IceNet "
-        f"{pd.to_datetime(fc_da.isel(time=leadtime).time.values).strftime('%d/%m/%Y')}"
-    )
-    tio = maps[1].set_title(
-        "OSISAF Obs "
-        f"{pd.to_datetime(obs_da.isel(time=leadtime).time.values).strftime('%d/%m/%Y')}"
-    )
+    tic = maps[0].set_title(f"IceNet {fc_labels[leadtime]}")
+    tio = maps[1].set_title(f"OSISAF Obs {obs_labels[leadtime]}")
     maps[2].set_title("Diff")
 
     p0 = maps[0].get_position().get_points().flatten()
@@ -1158,29 +1390,27 @@ def sic_error_video(fc_da: object, obs_da: object, land_mask: object,
     ax_cbar1 = fig.add_axes([p2[0] + 0.05, 0.04, p2[2] - p2[0], 0.02])
     plt.colorbar(im3, orientation='horizontal', cax=ax_cbar1)
 
+    # the land is static, so overlay it as an RGBA image rather than
+    # contouring the mask on each axes
+    land_rgba = np.zeros((*land_mask.shape, 4), dtype=np.uint8)
+    land_rgba[land_mask > .5] = mpl.cm.gray(180, bytes=True)
+
     for m_ax in maps[0:3]:
         m_ax.tick_params(
             labelbottom=False,
             labelleft=False,
         )
-        m_ax.contourf(land_mask,
-                      levels=[.5, 1],
-                      colors=[mpl.cm.gray(180)],
-                      zorder=3)
+        m_ax.imshow(land_rgba, interpolation="nearest", zorder=3)
 
     def update(date):
         logging.debug(f"Plotting {date}")
 
-        fc_plot = fc_da.isel(time=date).to_numpy()
-        obs_plot = obs_da.isel(time=date).to_numpy()
-        diff_plot = diff.isel(time=date).to_numpy()
+        fc_plot = fc_arr[date]
+        obs_plot = obs_arr[date]
+        diff_plot = diff_arr[date]
 
-        tic.set_text("IceNet {}".format(
-            pd.to_datetime(
-                fc_da.isel(time=date).time.values).strftime("%d/%m/%Y")))
-        tio.set_text("OSISAF Obs {}".format(
-            pd.to_datetime(
-                obs_da.isel(time=date).time.values).strftime("%d/%m/%Y")))
+        tic.set_text(f"IceNet {fc_labels[date]}")
+        tio.set_text(f"OSISAF Obs {obs_labels[date]}")
 
         im1.set_data(fc_plot)
         im2.set_data(obs_plot)
@@ -1188,18 +1418,20 @@ def sic_error_video(fc_da: object, obs_da: object, land_mask: object,
 
         return tic, tio, im1, im2, im3
 
-    animation = FuncAnimation(fig,
-                              update,
-                              range(0, len(fc_da.time)),
-                              interval=100)
-
-    plt.close()
-
     output_path = os.path.join("plot", "sic_error.mp4") \
         if not output_path else output_path
     logging.info(f"Saving to {output_path}")
-    animation.save(output_path, fps=10, extra_args=['-vcodec', 'libx264'])
-    return animation
+
+    # stream frames straight to ffmpeg, only the image data and titles
+    # change between frames
+    writer = FFMpegWriter(fps=10, codec="libx264")
+    with writer.saving(fig, output_path, dpi=150):
+        for date in range(len(fc_arr)):
+            update(date)
+            writer.grab_frame()
+
+    plt.close(fig)
+    return output_path
 
 
 def sic_error_local_header_data(da: xr.DataArray):
@@ -1452,6 +1684,52 @@ class ForecastPlotArgParser(argparse.ArgumentParser):
 #
 
 
+def _get_forecast_obs_da(hemisphere: str, forecast_date: object,
+                         fc: object) -> object:
+    """
+    Gets the observations covering the lead times of a forecast.
+
+    :param hemisphere: string, typically either 'north' or 'south'
+    :param forecast_date: initialisation date of the forecast
+    :param fc: an xarray.DataArray object with a leadtime coordinate
+
+    :return: an xarray.DataArray object of the observations
+    """
+    return get_obs_da(
+        hemisphere,
+        pd.to_datetime(forecast_date) + timedelta(days=1),
+        pd.to_datetime(forecast_date) + timedelta(days=int(fc.leadtime.max())))
+
+
+def _load_inputs(args: object, ecmwf: bool = False) -> tuple:
+    """
+    Loads the forecast, observations and, optionally, the ECMWF SEAS
+    forecast for a CLI endpoint, overlapping the file opens.
+
+    :param args: arguments parsed by a ForecastPlotArgParser
+    :param ecmwf: whether to load the ECMWF SEAS forecast
+
+    :return: tuple of (fc, obs, seas), seas being None if not loaded
+    """
+    fc = dask.delayed(get_forecast_ds)(args.forecast_file, args.forecast_date)
+    # the observation dates depend on the forecast lead times, so the
+    # SEAS forecast is the load which runs alongside this pair
+    obs = dask.delayed(_get_forecast_obs_da)(args.hemisphere,
+                                             args.forecast_date, fc)
+    seas = dask.delayed(get_seas_forecast_da)(
+        args.hemisphere, args.forecast_date,
+        bias_correct=args.bias_correct) if ecmwf else None
+
+    fc, obs, seas = dask.compute(fc, obs, seas, scheduler="threads")
+    fc = filter_ds_by_obs(fc, obs, args.forecast_date)
+
+    if seas is not None:
+        seas = seas.assign_coords(dict(xc=seas.xc / 1e3, yc=seas.yc / 1e3))
+        seas = seas.isel(time=slice(1, None))
+
+    return fc, obs, seas
+
+
 def binary_accuracy():
     """
     Produces plot of the binary classification accuracy of forecasts.
@@ -1462,30 +1740,12 @@ def binary_accuracy():
     masks = Masks(north=args.hemisphere == "north",
                   south=args.hemisphere == "south")
 
-    fc = get_forecast_ds(args.forecast_file, args.forecast_date)
-    obs = get_obs_da(
-        args.hemisphere,
-        pd.to_datetime(args.forecast_date) + timedelta(days=1),
-        pd.to_datetime(args.forecast_date) +
-        timedelta(days=int(fc.leadtime.max())))
-    fc = filter_ds_by_obs(fc, obs, args.forecast_date)
-
-    if args.ecmwf:
-        seas = get_seas_forecast_da(
-            args.hemisphere,
-            args.forecast_date,
-            bias_correct=args.bias_correct) \
-            if args.ecmwf else None
-
-        if seas is not None:
-            seas = seas.assign_coords(dict(xc=seas.xc / 1e3, yc=seas.yc / 1e3))
-            seas = seas.isel(time=slice(1, None))
-    else:
-        seas = None
+    fc, obs, seas = _load_inputs(args, ecmwf=args.ecmwf)
 
     if args.region:
         seas, fc, obs, masks = process_regions(args.region,
                                                [seas, fc, obs, masks])
+    seas, fc, obs = load_in_memory([seas, fc, obs])
 
     plot_binary_accuracy(masks=masks,
                          fc_da=fc,
@@ -1505,30 +1765,12 @@ def sie_error():
     masks = Masks(north=args.hemisphere == "north",
                   south=args.hemisphere == "south")
 
-    fc = get_forecast_ds(args.forecast_file, args.forecast_date)
-    obs = get_obs_da(
-        args.hemisphere,
-        pd.to_datetime(args.forecast_date) + timedelta(days=1),
-        pd.to_datetime(args.forecast_date) +
-        timedelta(days=int(fc.leadtime.max())))
-    fc = filter_ds_by_obs(fc, obs, args.forecast_date)
-
-    if args.ecmwf:
-        seas = get_seas_forecast_da(
-            args.hemisphere,
-            args.forecast_date,
-            bias_correct=args.bias_correct) \
-            if args.ecmwf else None
-
-        if seas is not None:
-            seas = seas.assign_coords(dict(xc=seas.xc / 1e3, yc=seas.yc / 1e3))
-            seas = seas.isel(time=slice(1, None))
-    else:
-        seas = None
+    fc, obs, seas = _load_inputs(args, ecmwf=args.ecmwf)
 
     if args.region:
         seas, fc, obs, masks = process_regions(args.region,
                                                [seas, fc, obs, masks])
+    seas, fc, obs = load_in_memory([seas, fc, obs])
 
     plot_sea_ice_extent_error(masks=masks,
                               fc_da=fc,
@@ -1690,14 +1932,17 @@ def plot_forecast():
 def parse_metrics_arg(argument: str) -> object:
     """
     Splits a string into a list by separating on commas.
-    Will remove any whitespace and removes duplicates.
-    Used to parsing metrics argument in metric_plots.
+    Will remove any whitespace, lowercase and remove duplicates, keeping
+    the order given. Used to parsing metrics argument in metric_plots.
 
     :param argument: string
 
     :return: list of metrics to compute
     """
-    return list(set([s.replace(" ", "") for s in argument.split(",")]))
+    return list(
+        dict.fromkeys(s.replace(" ", "").lower()
+                      for s in argument.split(",")
+                      if s.strip()))
 
 
 def metric_plots():
@@ -1710,32 +1955,13 @@ def metric_plots():
     masks = Masks(north=args.hemisphere == "north",
                   south=args.hemisphere == "south")
 
-    fc = get_forecast_ds(args.forecast_file, args.forecast_date)
-    obs = get_obs_da(
-        args.hemisphere,
-        pd.to_datetime(args.forecast_date) + timedelta(days=1),
-        pd.to_datetime(args.forecast_date) +
-        timedelta(days=int(fc.leadtime.max())))
-    fc = filter_ds_by_obs(fc, obs, args.forecast_date)
-
+    fc, obs, seas = _load_inputs(args, ecmwf=args.ecmwf)
     metrics = parse_metrics_arg(args.metrics)
 
-    if args.ecmwf:
-        seas = get_seas_forecast_da(
-            args.hemisphere,
-            args.forecast_date,
-            bias_correct=args.bias_correct) \
-            if args.ecmwf else None
-
-        if seas is not None:
-            seas = seas.assign_coords(dict(xc=seas.xc / 1e3, yc=seas.yc / 1e3))
-            seas = seas.isel(time=slice(1, None))
-    else:
-        seas = None
-
     if args.region:
         seas, fc, obs, masks = process_regions(args.region,
                                                [seas, fc, obs, masks])
+    seas, fc, obs = load_in_memory([seas, fc, obs])
 
     plot_metrics(metrics=metrics,
                  masks=masks,
@@ -1813,16 +2039,11 @@ def sic_error():
     masks = Masks(north=args.hemisphere == "north",
                   south=args.hemisphere == "south")
 
-    fc = get_forecast_ds(args.forecast_file, args.forecast_date)
-    obs = get_obs_da(
-        args.hemisphere,
-        pd.to_datetime(args.forecast_date) + timedelta(days=1),
-        pd.to_datetime(args.forecast_date) +
-        timedelta(days=int(fc.leadtime.max())))
-    fc = filter_ds_by_obs(fc, obs, args.forecast_date)
+    fc, obs, _ = _load_inputs(args)
 
     if args.region:
         fc, obs, masks = process_regions(args.region, [fc, obs, masks])
+    fc, obs = load_in_memory([fc, obs])
 
     sic_error_video(fc_da=fc,
                     obs_da=obs,
@@ -1838,13 +2059,7 @@ def sic_error_local():
     ap = (ForecastPlotArgParser().allow_probes())
     args = ap.parse_args()
 
-    fc = get_forecast_ds(args.forecast_file, args.forecast_date)
-    obs = get_obs_da(
-        args.hemisphere,
-        pd.to_datetime(args.forecast_date) + timedelta(days=1),
-        pd.to_datetime(args.forecast_date) +
-        timedelta(days=int(fc.leadtime.max())))
-    fc = filter_ds_by_obs(fc, obs, args.forecast_date)
+    fc, obs, _ = _load_inputs(args)
 
     fc, obs = process_probes(args.probes, [fc, obs])
 
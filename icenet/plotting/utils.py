@@ -435,7 +435,31 @@ def process_regions(region: tuple, data: tuple) -> tuple:
     x1, y1, x2, y2 = region
     assert x2 > x1 and y2 > y1, "Region is not valid"
 
+    # Nothing to slice if the region is the full domain
+    if (x1, y1, x2, y2) == (0, 0, 432, 432):
+        return data
+
+    region_slice = np.s_[..., (432 - y2):(432 - y1), x1:x2]
+
     for idx, arr in enumerate(data):
         if arr is not None:
-            data[idx] = arr[..., (432 - y2):(432 - y1), x1:x2]
+            data[idx] = arr[region_slice]
+    return data
+
+
+def load_in_memory(data: tuple, max_bytes: int = 2 * 1024**3) -> tuple:
+    """
+    Loads lazily evaluated (e.g. dask-backed) xarray objects into memory,
+    so that repeated reductions downstream evaluate the graph only once.
+    Objects larger than max_bytes, such as full domain data over long
+    periods, are left lazy.
+
+    :param data: A sequence of xarray objects, entries may be None
+    :param max_bytes: Largest object, in bytes, to load into memory
+
+    :return: data, with small enough objects loaded
+    """
+    for idx, arr in enumerate(data):
+        if arr is not None and arr.nbytes <= max_bytes:
+            data[idx] = arr.load()
     return data
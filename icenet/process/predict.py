@@ -70,16 +70,34 @@ def get_prediction_data(root: object, name: object, date: object) -> tuple:
     """
     logging.info("Post-processing {}".format(date))
 
-    glob_str = os.path.join(root, "results", "predict", name, "*",
-                            date.strftime("%Y_%m_%d.npy"))
+    date_key = date.strftime("%Y_%m_%d")
+    np_files = []
+    data = []
+
+    # Each ensemble member folder holds the date either as its own file, or
+    # within a single forecasts.npz, and contributes one member either way
+    for member_dir in sorted(
+            glob.glob(os.path.join(root, "results", "predict", name, "*"))):
+        np_file = os.path.join(member_dir, "{}.npy".format(date_key))
+        npz_file = os.path.join(member_dir, "forecasts.npz")
+
+        if os.path.exists(np_file):
+            data.append(np.load(np_file))
+            np_files.append(np_file)
+        elif os.path.exists(npz_file):
+            with np.load(npz_file) as npz_data:
+                if date_key in npz_data.files:
+                    data.append(npz_data[date_key])
+                    np_files.append(npz_file)
 
-    np_files = glob.glob(glob_str)
     if not len(np_files):
         logging.warning("No files found")
         return None
 
-    data = [np.load(f) for f in np_files]
-    data = np.array(data)
+    # Predictions may have been stored quantised to 1/255ths
+    data = np.array(
+        [arr / 255. if arr.dtype == np.uint8 else arr for arr in data],
+        dtype=np.float32)
     ens_members = data.shape[0]
 
     logging.debug("Data read from disk: {} from: {}".format(